@@ -15,13 +15,22 @@ class F1BetSimulator:
         self.bet_amount = bet_amount
         self.simulation_log = []
         
+    @staticmethod
+    def _read_table(path):
+        """Read a CSV or Parquet file depending on the extension"""
+        if str(path).endswith('.parquet'):
+            return pd.read_parquet(path)
+        # Driver/Race_Name haben wenige eindeutige Werte - category
+        # macht die Merge- und Vergleichsoperationen zu int-Vergleichen
+        return pd.read_csv(path, dtype={'Driver': 'category', 'Race_Name': 'category'})
+
     def load_betting_recommendations(self, csv_path):
         """
-        Load betting recommendations from CSV
+        Load betting recommendations from CSV or Parquet
         Expected columns: Driver, Quote, Predicted_Probability, EV, Race_Name
         """
         try:
-            self.betting_df = pd.read_csv(csv_path)
+            self.betting_df = self._read_table(csv_path)
             print(f"✅ Loaded {len(self.betting_df)} betting recommendations")
             return True
         except Exception as e:
@@ -30,11 +39,11 @@ class F1BetSimulator:
     
     def load_race_results(self, csv_path):
         """
-        Load actual race results from CSV
+        Load actual race results from CSV or Parquet
         Expected columns: Driver, Actual_Position, Race_Name
         """
         try:
-            self.results_df = pd.read_csv(csv_path)
+            self.results_df = self._read_table(csv_path)
             print(f"✅ Loaded results for {len(self.results_df)} drivers")
             return True
         except Exception as e:
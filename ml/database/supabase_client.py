@@ -24,6 +24,16 @@ class F1SupabaseClient:
             print(f"[ERROR] Failed to create Supabase client: {e}")
             raise
     
+    def store_batch(self, records, table):
+        """Insert multiple records into one table with a single REST call
+
+        returning='minimal' keeps the response empty instead of echoing
+        every inserted row back over the wire.
+        """
+        if not records:
+            return None
+        return self.supabase.table(table).insert(records, returning='minimal').execute()
+
     def store_odds_data(self, odds_df, race_name):
         """Store betting odds with timestamps"""
         try:
@@ -52,7 +62,7 @@ class F1SupabaseClient:
                     record['odds'] = float(record['odds'])
             
             # Insert into Supabase
-            result = self.supabase.table('odds_history').insert(odds_records).execute()
+            result = self.store_batch(odds_records, 'odds_history')
             self.logger.info(f"[OK] Stored {len(odds_records)} odds records for {race_name}")
             return result
             
@@ -78,7 +88,7 @@ class F1SupabaseClient:
                     if field in record and record[field] is not None:
                         record[field] = float(record[field])
             
-            result = self.supabase.table('predictions').insert(predictions_records).execute()
+            result = self.store_batch(predictions_records, 'predictions')
             self.logger.info(f"[OK] Stored {len(predictions_records)} predictions for {race_name}")
             return result
             
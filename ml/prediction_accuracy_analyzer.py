@@ -9,6 +9,29 @@ from typing import Dict, List, Tuple, Any
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import orjson
+
+    def _dump_json(obj, path):
+        # Rust-Encoder mit nativer numpy-Unterstützung - kein default()-
+        # Aufruf pro numpy-Skalar, Bytes statt Zwischen-String
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                obj,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ))
+except ImportError:
+    def _dump_json(obj, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False, default=str)
+
 class PredictionAccuracyAnalyzer:
     """
     Analysiert die Genauigkeit von F1-Vorhersagen und lernt aus Fehlern
@@ -19,6 +42,11 @@ class PredictionAccuracyAnalyzer:
         self.config = self.load_config()
         self.analysis_results = []
         self.learning_insights = []
+
+        # Historien-Zeilen werden gepuffert und gesammelt angehängt statt
+        # pro Rennen eine eigene CSV-Schreibrunde zu fahren
+        self._history_buffer: List[Dict[str, Any]] = []
+        self._flush_every = self.config.get('history_flush_every', 1)
         
     def load_config(self) -> Dict[str, Any]:
         """Lädt Konfiguration oder erstellt Standard-Konfiguration"""
@@ -85,7 +113,19 @@ class PredictionAccuracyAnalyzer:
             }
             
             self.analysis_results.append(race_analysis)
-            
+            self._history_buffer.append({
+                'race_name': race_analysis['race_name'],
+                'timestamp': race_analysis['timestamp'],
+                'overall_score': race_analysis['overall_score'],
+                'exact_accuracy': position_accuracy['exact_accuracy'],
+                'within_3_accuracy': position_accuracy['within_3_accuracy'],
+                'top3_accuracy': position_accuracy['top3_accuracy'],
+                'calibration_score': probability_calibration['calibration_score']
+            })
+            if len(self._history_buffer) >= self._flush_every:
+                self._flush_history()
+
+
             # Generiere Lernerkenntnisse
             insights = self._generate_learning_insights(race_analysis)
             self.learning_insights.extend(insights)
@@ -409,6 +449,43 @@ class PredictionAccuracyAnalyzer:
         
         return recommendations
     
+    @staticmethod
+    def _save_msgpack_sidecar(json_path: str, data: Any):
+        """Schreibt zusätzlich eine msgpack-Variante neben die JSON-Datei
+
+        msgpack dekodiert die verschachtelten Strukturen mehrfach schneller
+        als JSON; die JSON-Datei bleibt als lesbares Debug-Format erhalten.
+        """
+        if not MSGPACK_AVAILABLE:
+            return
+        try:
+            with open(json_path + '.msgpack', 'wb') as f:
+                f.write(msgpack.packb(data, use_bin_type=True, default=str))
+        except Exception as e:
+            print(f"⚠️ msgpack-Sidecar konnte nicht geschrieben werden: {e}")
+
+    @staticmethod
+    def load_results_fast(json_path: str) -> Any:
+        """Lädt Analyse-Daten bevorzugt aus der msgpack-Variante
+
+        Das Sidecar zählt nur, wenn es mindestens so neu ist wie die
+        JSON-Datei - wurde das JSON in einer Umgebung ohne msgpack neu
+        geschrieben, würde ein altes Sidecar sonst veraltete Daten
+        liefern.
+        """
+        msgpack_path = json_path + '.msgpack'
+        if MSGPACK_AVAILABLE and os.path.exists(msgpack_path):
+            try:
+                sidecar_fresh = os.path.getmtime(msgpack_path) >= os.path.getmtime(json_path)
+            except OSError:
+                # Kein JSON (mehr) vorhanden - das Sidecar ist alles, was wir haben
+                sidecar_fresh = True
+            if sidecar_fresh:
+                with open(msgpack_path, 'rb') as f:
+                    return msgpack.unpackb(f.read(), raw=False)
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
     def save_analysis_results(self):
         """Speichert alle Analyseergebnisse"""
         output_dir = self.config['output_directory']
@@ -416,35 +493,38 @@ class PredictionAccuracyAnalyzer:
         
         # Speichere Analyseergebnisse
         results_file = os.path.join(output_dir, 'analysis_results.json')
-        with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump(self.analysis_results, f, indent=2, ensure_ascii=False, default=str)
-        
+        _dump_json(self.analysis_results, results_file)
+        self._save_msgpack_sidecar(results_file, self.analysis_results)
+
         # Speichere Lernerkenntnisse
         insights_file = self.config['learning_log_file']
         os.makedirs(os.path.dirname(insights_file), exist_ok=True)
-        with open(insights_file, 'w', encoding='utf-8') as f:
-            json.dump(self.learning_insights, f, indent=2, ensure_ascii=False, default=str)
-        
-        # Speichere Genauigkeits-Historie
-        if self.analysis_results:
-            history_data = []
-            for result in self.analysis_results:
-                history_data.append({
-                    'race_name': result['race_name'],
-                    'timestamp': result['timestamp'],
-                    'overall_score': result['overall_score'],
-                    'exact_accuracy': result['position_accuracy']['exact_accuracy'],
-                    'within_3_accuracy': result['position_accuracy']['within_3_accuracy'],
-                    'top3_accuracy': result['position_accuracy']['top3_accuracy'],
-                    'calibration_score': result['probability_calibration']['calibration_score']
-                })
-            
-            history_df = pd.DataFrame(history_data)
-            history_file = self.config['accuracy_history_file']
-            os.makedirs(os.path.dirname(history_file), exist_ok=True)
-            history_df.to_csv(history_file, index=False)
+        _dump_json(self.learning_insights, insights_file)
+        self._save_msgpack_sidecar(insights_file, self.learning_insights)
         
+        # Speichere Genauigkeits-Historie (restliche gepufferte Zeilen)
+        self._flush_history()
+
         print(f"💾 Analyseergebnisse gespeichert in {output_dir}")
+
+    def _flush_history(self):
+        """Hängt alle gepufferten Historien-Zeilen in einem Schreibvorgang an
+
+        Ein mode='a'-Write pro Flush statt einer kompletten Neukodierung
+        der Historie pro Rennen; der Header wird nur beim Anlegen der
+        Datei geschrieben.
+        """
+        if not self._history_buffer:
+            return
+
+        history_file = self.config['accuracy_history_file']
+        os.makedirs(os.path.dirname(history_file), exist_ok=True)
+        write_header = not os.path.exists(history_file)
+
+        pd.DataFrame(self._history_buffer).to_csv(
+            history_file, mode='a', header=write_header, index=False
+        )
+        self._history_buffer.clear()
     
     def create_visualization(self, output_file: str = None):
         """Erstellt Visualisierungen der Analyseergebnisse"""
@@ -6,6 +6,7 @@ Ein Python-Client für die OpenF1 API (https://openf1.org/)
 zum Abrufen von F1-Daten in CSV- und JSON-Format.
 """
 
+import asyncio
 import requests
 import pandas as pd
 import json
@@ -15,14 +16,134 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Transiente Fehler, bei denen sich ein Wiederholungsversuch lohnt
+_RETRY_STATUS = (429, 502, 503, 504)
+
+def _is_permanent_status_error(exc):
+    """Status-Fehler außerhalb von _RETRY_STATUS (404, 400, 401, ...)
+    sind endgültig - Backoff-Wiederholungen kosten nur Zeit.
+    Funktioniert für httpx.HTTPStatusError und requests.HTTPError,
+    beide tragen die Response am Fehler."""
+    response = getattr(exc, 'response', None)
+    status = getattr(response, 'status_code', None)
+    return status is not None and status not in _RETRY_STATUS
+
 class OpenF1Client:
     """Client für die OpenF1 API"""
-    
-    def __init__(self, base_url="https://api.openf1.org/v1", rate_limit_seconds=0.5):
+
+    def __init__(self, base_url="https://api.openf1.org/v1", rate_limit_seconds=0.5,
+                 max_retries=3):
         self.base_url = base_url
         self.rate_limit_seconds = rate_limit_seconds
+        self.max_retries = max_retries
         self.last_request_time = 0
-        
+
+        # Eine wiederverwendete Verbindung statt TLS-Handshake pro Request;
+        # mit httpx zusätzlich HTTP/2-Multiplexing über einen Stream.
+        # Ausnahme: hat requests-cache per install_cache() requests.Session
+        # gepatcht, bekommt die gecachte Session Vorrang - httpx liefe am
+        # Cache vorbei und jeder Lauf ginge wieder übers Netz
+        cache_patched = requests.Session.__module__.startswith('requests_cache')
+        self._use_httpx = HTTPX_AVAILABLE and not cache_patched
+        if self._use_httpx:
+            limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+            try:
+                self._session = httpx.Client(http2=True, limits=limits, timeout=30)
+            except ImportError:
+                # http2-Extra (h2) nicht installiert - Pooling bringt trotzdem viel
+                self._session = httpx.Client(limits=limits, timeout=30)
+            self._request_error = httpx.HTTPError
+        else:
+            self._session = requests.Session()
+            self._request_error = requests.exceptions.RequestException
+
+        self._async_session = None
+        self._async_lock = None
+
+    async def aget(self, endpoint: str, params: Dict[str, Any] = None) -> Optional[List[Dict]]:
+        """Asynchrone Request-Variante für asyncio.gather.
+
+        Mit httpx läuft der Request über einen geteilten AsyncClient,
+        sonst wird der blockierende Pfad in einen Thread ausgelagert -
+        in beiden Fällen überlappen parallele Abrufe ihre Wartezeiten.
+        """
+        if not self._use_httpx:
+            return await asyncio.to_thread(self._make_request, endpoint, params)
+
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+
+        # Rate limiting - serialisiert nur den Abstand zwischen den
+        # Request-Starts, nicht die Antworten
+        async with self._async_lock:
+            wait = self.rate_limit_seconds - (time.time() - self.last_request_time)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self.last_request_time = time.time()
+
+            if self._async_session is None:
+                limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+                self._async_session = httpx.AsyncClient(limits=limits, timeout=30)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._async_session.get(f"{self.base_url}/{endpoint}", params=params)
+                if response.status_code in _RETRY_STATUS and attempt < self.max_retries:
+                    await asyncio.sleep(self._retry_delay(attempt, response.headers.get('Retry-After')))
+                    continue
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPError as e:
+                # Nur Verbindungs-/Timeout-Fehler wiederholen; endgültige
+                # Status sofort aufgeben statt sie mit Backoff zu strecken
+                if not _is_permanent_status_error(e) and attempt < self.max_retries:
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+                print(f"API Request failed: {e}")
+                return None
+
+    @staticmethod
+    def _retry_delay(attempt, retry_after=None):
+        """Exponentielles Backoff, Retry-After-Header hat Vorrang"""
+        delay = 0.5 * (2 ** attempt)
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        return delay
+
+    async def aget_sessions(self, year: int = None, session_name: str = None,
+                            session_type: str = None, country_name: str = None) -> Optional[List[Dict]]:
+        """Asynchrone Variante von get_sessions"""
+        params = {}
+        if year:
+            params['year'] = year
+        if session_name:
+            params['session_name'] = session_name
+        if session_type:
+            params['session_type'] = session_type
+        if country_name:
+            params['country_name'] = country_name
+
+        return await self.aget('sessions', params)
+
+    async def aclose(self):
+        """Schließe den Async-Client (falls einer geöffnet wurde)"""
+        if self._async_session is not None:
+            await self._async_session.aclose()
+            self._async_session = None
+        # Lock mit zurücksetzen - er ist an den aktuellen Event-Loop
+        # gebunden und würde einem späteren asyncio.run() sonst einen
+        # "bound to a different event loop"-RuntimeError bescheren
+        self._async_lock = None
+
     def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Optional[List[Dict]]:
         """Führe API-Request mit Rate Limiting durch"""
         # Rate limiting
@@ -30,18 +151,31 @@ class OpenF1Client:
         time_since_last = current_time - self.last_request_time
         if time_since_last < self.rate_limit_seconds:
             time.sleep(self.rate_limit_seconds - time_since_last)
-        
-        try:
-            url = f"{self.base_url}/{endpoint}"
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            self.last_request_time = time.time()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            print(f"API Request failed: {e}")
-            return None
+
+        url = f"{self.base_url}/{endpoint}"
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._session.get(url, params=params, timeout=30)
+
+                # Transiente Status (Rate Limit, Gateway-Fehler) mit
+                # Backoff wiederholen statt den Lauf rot zu machen
+                if response.status_code in _RETRY_STATUS and attempt < self.max_retries:
+                    time.sleep(self._retry_delay(attempt, response.headers.get('Retry-After')))
+                    continue
+
+                response.raise_for_status()
+
+                self.last_request_time = time.time()
+                return response.json()
+
+            except self._request_error as e:
+                # Nur Verbindungs-/Timeout-Fehler wiederholen; endgültige
+                # Status sofort aufgeben statt sie mit Backoff zu strecken
+                if not _is_permanent_status_error(e) and attempt < self.max_retries:
+                    time.sleep(self._retry_delay(attempt))
+                    continue
+                print(f"API Request failed: {e}")
+                return None
     
     def get_car_data(self, session_key: int = None, driver_number: int = None, 
                      date_start: str = None, date_end: str = None) -> Optional[List[Dict]]:
@@ -194,7 +328,8 @@ class OpenF1DataCollector:
         self.config_file = config_file
         self.config = self.load_config()
         self.client = OpenF1Client(
-            rate_limit_seconds=self.config.get('rate_limit_seconds', 0.5)
+            rate_limit_seconds=self.config.get('rate_limit_seconds', 0.5),
+            max_retries=self.config.get('max_retries', 3)
         )
         
     def load_config(self) -> Dict[str, Any]:
@@ -234,7 +369,24 @@ class OpenF1DataCollector:
             
         return df
     
-    def collect_laps(self, session_key: int = None, driver_number: int = None, 
+    async def acollect_drivers(self, session_key: int = None) -> Optional[pd.DataFrame]:
+        """Asynchrone Variante von collect_drivers"""
+        params = {'session_key': session_key} if session_key else {}
+        data = await self.client.aget('drivers', params)
+        return pd.DataFrame(data) if data else None
+
+    async def acollect_position(self, session_key: int = None,
+                                driver_number: int = None) -> Optional[pd.DataFrame]:
+        """Asynchrone Variante von collect_position"""
+        params = {}
+        if session_key:
+            params['session_key'] = session_key
+        if driver_number:
+            params['driver_number'] = driver_number
+        data = await self.client.aget('position', params)
+        return pd.DataFrame(data) if data else None
+
+    def collect_laps(self, session_key: int = None, driver_number: int = None,
                      save_to_file: bool = False, output_format: str = "csv") -> Optional[pd.DataFrame]:
         """Sammle Rundendaten"""
         data = self.client.get_laps(session_key=session_key, driver_number=driver_number)
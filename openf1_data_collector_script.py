@@ -9,8 +9,12 @@ und speichert sie in strukturierter Form für die weitere Analyse.
 import os
 import sys
 import json
+import heapq
+import logging
+import operator
 import argparse
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -19,20 +23,59 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from openf1_api_client import OpenF1Client, OpenF1DataCollector
 
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 class OpenF1DataCollectionManager:
     """Manager für die automatische OpenF1 Datensammlung"""
-    
+
+    # Zuordnung Datentyp -> Collector-Methode (treibt collect_session_data)
+    _DATA_TYPE_METHODS = {
+        "drivers": "collect_drivers",
+        "positions": "collect_position",
+        "laps": "collect_laps",
+        "intervals": "collect_intervals",
+        "pit_stops": "collect_pit",
+        "weather": "collect_weather",
+        "stints": "collect_stints",
+    }
+
     def __init__(self, config_file="config/openf1_config.json"):
         self.config_file = config_file
         self.config = self.load_config()
         self.client = OpenF1Client()
         self.collector = OpenF1DataCollector(config_file=config_file)
+        self._sessions_cache = {}
+
+        # Output-Verzeichnis einmal anlegen statt bei jedem Speichern
+        self.output_dir = Path(self.config['output_paths']['raw_data'])
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         
     def load_config(self):
         """Lade OpenF1 Konfiguration"""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(Path(self.config_file).read_bytes())
         except FileNotFoundError:
             print(f"⚠️ Config file not found: {self.config_file}")
             return self.get_default_config()
@@ -50,155 +93,195 @@ class OpenF1DataCollectionManager:
             }
         }
     
+    def _get_sessions_cached(self, year=None):
+        """Hole Sessions mit In-Process-Cache pro Jahr"""
+        if year not in self._sessions_cache:
+            self._sessions_cache[year] = self.client.get_sessions(year=year) or []
+        return self._sessions_cache[year]
+
     def get_recent_sessions(self, year=None, session_type=None, limit=10):
         """Hole aktuelle Sessions"""
         if year is None:
             year = datetime.now().year
             
         try:
-            sessions = self.client.get_sessions(year=year)
-            
+            sessions = list(self._get_sessions_cached(year=year))
+
             if session_type:
                 sessions = [s for s in sessions if s.get('session_type') == session_type]
-            
-            # Sort by date (newest first)
-            sessions.sort(key=lambda x: x.get('date_start', ''), reverse=True)
-            
-            return sessions[:limit]
+
+            # Fehlende Daten einmal normalisieren, dann C-implementierter
+            # Key; nlargest ist O(n log limit) statt Vollsortierung
+            for session in sessions:
+                session.setdefault('date_start', '')
+
+            return heapq.nlargest(limit, sessions, key=operator.itemgetter('date_start'))
             
         except Exception as e:
             print(f"❌ Error fetching sessions: {e}")
             return []
     
+    @staticmethod
+    def _optimize_df(df):
+        """Verkleinere DataFrame-Speicher via category- und Downcast-Dtypes
+
+        F1-Daten wiederholen sich stark (driver_number, compound,
+        team_name, ...) - category-Spalten und downgecastete Zahlen
+        sparen ein Mehrfaches an RAM und verkleinern die Ausgabedateien.
+        """
+        for col in df.columns:
+            if df[col].dtype == 'object':
+                # Spalten mit Listen (z.B. segments_sector_* aus /laps)
+                # sind nicht hashbar - die bleiben einfach object
+                try:
+                    sparse = len(df) and df[col].nunique(dropna=True) / len(df) < 0.5
+                except TypeError:
+                    continue
+                if sparse:
+                    df[col] = df[col].astype('category')
+            elif pd.api.types.is_integer_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            elif pd.api.types.is_float_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], downcast='float')
+        return df
+
     def collect_session_data(self, session_key, session_name="Unknown", data_types=None):
         """Sammle alle Daten für eine Session"""
         if data_types is None:
             data_types = self.config['integration']['collect_data_types']
         
-        print(f"\n📊 Collecting data for session: {session_name} (Key: {session_key})")
-        
+        logger.info("📊 Collecting data for session: %s (Key: %s)", session_name, session_key)
+
         collected_data = {}
-        
-        # Drivers
-        if "drivers" in data_types:
-            try:
-                drivers_df = self.collector.collect_drivers(session_key=session_key)
-                if drivers_df is not None and not drivers_df.empty:
-                    collected_data['drivers'] = drivers_df
-                    print(f"✅ Drivers: {len(drivers_df)} records")
-                else:
-                    print("⚠️ No drivers data")
-            except Exception as e:
-                print(f"❌ Drivers collection failed: {e}")
-        
-        # Positions
-        if "positions" in data_types:
-            try:
-                positions_df = self.collector.collect_position(session_key=session_key)
-                if positions_df is not None and not positions_df.empty:
-                    collected_data['positions'] = positions_df
-                    print(f"✅ Positions: {len(positions_df)} records")
-                else:
-                    print("⚠️ No positions data")
-            except Exception as e:
-                print(f"❌ Positions collection failed: {e}")
-        
-        # Laps
-        if "laps" in data_types:
-            try:
-                laps_df = self.collector.collect_laps(session_key=session_key)
-                if laps_df is not None and not laps_df.empty:
-                    collected_data['laps'] = laps_df
-                    print(f"✅ Laps: {len(laps_df)} records")
-                else:
-                    print("⚠️ No laps data")
-            except Exception as e:
-                print(f"❌ Laps collection failed: {e}")
-        
-        # Intervals
-        if "intervals" in data_types:
-            try:
-                intervals_df = self.collector.collect_intervals(session_key=session_key)
-                if intervals_df is not None and not intervals_df.empty:
-                    collected_data['intervals'] = intervals_df
-                    print(f"✅ Intervals: {len(intervals_df)} records")
-                else:
-                    print("⚠️ No intervals data")
-            except Exception as e:
-                print(f"❌ Intervals collection failed: {e}")
-        
-        # Pit stops
-        if "pit_stops" in data_types:
-            try:
-                pit_df = self.collector.collect_pit(session_key=session_key)
-                if pit_df is not None and not pit_df.empty:
-                    collected_data['pit_stops'] = pit_df
-                    print(f"✅ Pit stops: {len(pit_df)} records")
-                else:
-                    print("⚠️ No pit stops data")
-            except Exception as e:
-                print(f"❌ Pit stops collection failed: {e}")
-        
-        # Weather
-        if "weather" in data_types:
-            try:
-                weather_df = self.collector.collect_weather(session_key=session_key)
-                if weather_df is not None and not weather_df.empty:
-                    collected_data['weather'] = weather_df
-                    print(f"✅ Weather: {len(weather_df)} records")
-                else:
-                    print("⚠️ No weather data")
-            except Exception as e:
-                print(f"❌ Weather collection failed: {e}")
-        
-        # Stints
-        if "stints" in data_types:
+        summary = []
+
+        for data_type in data_types:
+            method_name = self._DATA_TYPE_METHODS.get(data_type)
+            if method_name is None:
+                summary.append(f"{data_type}: unknown type")
+                continue
+
             try:
-                stints_df = self.collector.collect_stints(session_key=session_key)
-                if stints_df is not None and not stints_df.empty:
-                    collected_data['stints'] = stints_df
-                    print(f"✅ Stints: {len(stints_df)} records")
+                df = getattr(self.collector, method_name)(session_key=session_key)
+                if df is not None and not df.empty:
+                    collected_data[data_type] = self._optimize_df(df)
+                    summary.append(f"{data_type}: {len(df)}")
                 else:
-                    print("⚠️ No stints data")
+                    summary.append(f"{data_type}: no data")
             except Exception as e:
-                print(f"❌ Stints collection failed: {e}")
-        
+                summary.append(f"{data_type}: error ({e})")
+                logger.warning("❌ %s collection failed: %s", data_type, e)
+
+        # Eine Zusammenfassungszeile pro Session statt 1-2 prints pro Typ
+        logger.info("✅ %s - %s", session_name, ", ".join(summary))
+
         return collected_data
     
+    def collect_session_data_streaming(self, session_key, session_name="Unknown",
+                                       data_types=None, batch_size=10_000):
+        """Sammle und schreibe Session-Daten typweise als Parquet-Stream
+
+        Hält immer nur einen Datentyp im Speicher: jeder DataFrame wird
+        direkt nach dem Abruf in RecordBatch-Stücken auf die Platte
+        geschrieben und wieder freigegeben. Benötigt pyarrow.
+        """
+        if not PYARROW_AVAILABLE:
+            print("⚠️ pyarrow not available - falling back to in-memory collection")
+            collected_data = self.collect_session_data(session_key, session_name, data_types)
+            return self.save_session_data(session_key, session_name, collected_data)
+
+        if data_types is None:
+            data_types = self.config['integration']['collect_data_types']
+
+        print(f"\n📊 Streaming data for session: {session_name} (Key: {session_key})")
+
+        safe_name = session_name.lower().replace(' ', '_').replace('grand_prix', 'gp')
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+
+        output_dir = self.output_dir
+
+        saved_files = []
+
+        for data_type in data_types:
+            method_name = self._DATA_TYPE_METHODS.get(data_type)
+            if method_name is None:
+                continue
+
+            try:
+                df = getattr(self.collector, method_name)(session_key=session_key)
+                if df is None or df.empty:
+                    print(f"⚠️ No {data_type.replace('_', ' ')} data")
+                    continue
+
+                filepath = output_dir / f"{safe_name}_{session_key}_{data_type}_{timestamp}.parquet"
+                table = pa.Table.from_pandas(df, preserve_index=False)
+
+                with pq.ParquetWriter(filepath, table.schema) as writer:
+                    for batch in table.to_batches(max_chunksize=batch_size):
+                        writer.write_batch(batch)
+
+                saved_files.append(str(filepath))
+                print(f"💾 Streamed {data_type}: {filepath} ({len(df)} records)")
+
+                # DataFrame und Table sofort freigeben, bevor der nächste
+                # Datentyp geladen wird
+                del df, table
+
+            except Exception as e:
+                print(f"❌ {data_type} streaming failed: {e}")
+
+        return saved_files
+
+    def _write_one(self, data_type, df, output_dir, safe_name, session_key, timestamp):
+        """Schreibe eine einzelne Datentyp-CSV und gib den Pfad zurück"""
+        filename = f"{safe_name}_{session_key}_{data_type}_{timestamp}.csv"
+        filepath = output_dir / filename
+
+        # Gepufferter Binär-Writer: Chunks landen im 4-MB-Puffer
+        # statt pro Zeile im Default-Buffer
+        with open(filepath, 'wb', buffering=4 * 1024 * 1024) as fh:
+            df.to_csv(fh, index=False, chunksize=50_000)
+
+        print(f"💾 Saved {data_type}: {filepath}")
+        return str(filepath)
+
     def save_session_data(self, session_key, session_name, collected_data):
         """Speichere gesammelte Session-Daten"""
         try:
             # Create safe filename
             safe_name = session_name.lower().replace(' ', '_').replace('grand_prix', 'gp')
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-            
-            # Ensure output directory exists
-            output_dir = Path(self.config['output_paths']['raw_data'])
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            saved_files = []
+
+            # Ein einziger Zeitstempel pro Aufruf - Dateinamen und
+            # Metadaten bleiben so garantiert konsistent
+            now = datetime.now()
+            timestamp = now.strftime('%Y%m%d_%H%M')
+
+            output_dir = self.output_dir
             
-            for data_type, df in collected_data.items():
-                if df is not None and not df.empty:
-                    filename = f"{safe_name}_{session_key}_{data_type}_{timestamp}.csv"
-                    filepath = output_dir / filename
-                    
-                    df.to_csv(filepath, index=False)
-                    saved_files.append(str(filepath))
-                    print(f"💾 Saved {data_type}: {filepath}")
+            # Schreibe alle Datentypen parallel - jede CSV-Ausgabe gibt den
+            # GIL während des I/O frei
+            writable = [(dt, df) for dt, df in collected_data.items()
+                        if df is not None and not df.empty]
+
+            with ThreadPoolExecutor(max_workers=max(len(writable), 1)) as executor:
+                futures = [
+                    executor.submit(self._write_one, data_type, df,
+                                    output_dir, safe_name, session_key, timestamp)
+                    for data_type, df in writable
+                ]
+                saved_files = [f.result() for f in futures]
             
             # Save metadata
             metadata = {
                 "session_key": session_key,
                 "session_name": session_name,
-                "collection_timestamp": datetime.now().isoformat(),
+                "collection_timestamp": now.isoformat(),
                 "data_types": list(collected_data.keys()),
                 "files": saved_files
             }
             
             metadata_file = output_dir / f"{safe_name}_{session_key}_metadata_{timestamp}.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            metadata_file.write_bytes(_json_dumps(metadata))
             
             print(f"📋 Metadata saved: {metadata_file}")
             
@@ -243,15 +326,10 @@ class OpenF1DataCollectionManager:
     def collect_specific_session(self, session_key, data_types=None):
         """Sammle Daten für eine spezifische Session"""
         try:
-            # Get session info
-            sessions = self.client.get_sessions()
-            session_info = None
-            
-            for session in sessions:
-                if session['session_key'] == session_key:
-                    session_info = session
-                    break
-            
+            # Get session info (cached - one API call per process, O(1) lookup)
+            sessions_idx = {s['session_key']: s for s in self._get_sessions_cached()}
+            session_info = sessions_idx.get(session_key)
+
             if not session_info:
                 print(f"❌ Session {session_key} not found")
                 return
@@ -289,7 +367,9 @@ def main():
                        help="Path to config file")
     
     args = parser.parse_args()
-    
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     manager = OpenF1DataCollectionManager(args.config)
     
     if args.command == "recent":
@@ -306,15 +386,13 @@ def main():
         
     elif args.command == "list":
         print("📅 Available sessions:")
-        sessions = manager.get_recent_sessions(year=args.year, limit=args.limit)
-        
-        for session in sessions:
-            session_key = session['session_key']
-            session_name = session.get('session_name', 'Unknown')
-            session_type = session.get('session_type', 'Unknown')
-            date_start = session.get('date_start', 'Unknown')
-            
-            print(f"  {session_key}: {session_name} ({session_type}) - {date_start}")
+        # Ein Durchlauf: Ausgabe wird in einem String gesammelt und mit
+        # einem einzigen print geschrieben
+        print("\n".join(
+            f"  {s['session_key']}: {s.get('session_name', 'Unknown')} "
+            f"({s.get('session_type', 'Unknown')}) - {s.get('date_start', 'Unknown')}"
+            for s in manager.get_recent_sessions(year=args.year, limit=args.limit)
+        ))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,23 +4,9 @@ Supabase Tables Setup Guide
 Zeigt die SQL-Befehle an, die in der Supabase-Konsole ausgeführt werden müssen
 """
 
-def show_setup_instructions():
-    print("🗄️ F1 Analytics Hub - Supabase Setup")
-    print("=" * 60)
-    print()
-    print("⚠️  WICHTIG: Diese SQL-Befehle müssen in der Supabase-Konsole ausgeführt werden!")
-    print()
-    print("📋 Schritte:")
-    print("1. Gehe zu: https://ffgkrmpuwqtjtevpnnsj.supabase.co")
-    print("2. Klicke auf 'SQL Editor' in der linken Seitenleiste")
-    print("3. Kopiere und füge die folgenden SQL-Befehle ein")
-    print("4. Klicke auf 'Run' um die Befehle auszuführen")
-    print()
-    print("=" * 60)
-    print("📝 SQL-BEFEHLE ZUM KOPIEREN:")
-    print("=" * 60)
-    
-    sql_commands = """
+# Komplettes Schema als Modul-Konstante - wird nur einmal beim Import
+# angelegt statt bei jedem Funktionsaufruf
+_SCHEMA_SQL = """
 -- F1 Analytics Hub Database Schema
 
 -- 1. ODDS_HISTORY TABLE
@@ -164,8 +150,24 @@ CREATE POLICY "Enable all operations for service role" ON session_data
 CREATE POLICY "Enable all operations for service role" ON weather_data
     FOR ALL USING (true);
 """
+
+def show_setup_instructions():
+    print("🗄️ F1 Analytics Hub - Supabase Setup")
+    print("=" * 60)
+    print()
+    print("⚠️  WICHTIG: Diese SQL-Befehle müssen in der Supabase-Konsole ausgeführt werden!")
+    print()
+    print("📋 Schritte:")
+    print("1. Gehe zu: https://ffgkrmpuwqtjtevpnnsj.supabase.co")
+    print("2. Klicke auf 'SQL Editor' in der linken Seitenleiste")
+    print("3. Kopiere und füge die folgenden SQL-Befehle ein")
+    print("4. Klicke auf 'Run' um die Befehle auszuführen")
+    print()
+    print("=" * 60)
+    print("📝 SQL-BEFEHLE ZUM KOPIEREN:")
+    print("=" * 60)
     
-    print(sql_commands)
+    print(_SCHEMA_SQL)
     print("=" * 60)
     print()
     print("✅ Nach der Ausführung der SQL-Befehle:")
@@ -175,6 +177,45 @@ CREATE POLICY "Enable all operations for service role" ON weather_data
     print()
     print("🔗 Supabase Dashboard: https://ffgkrmpuwqtjtevpnnsj.supabase.co")
 
+def apply_schema():
+    """Führe das komplette Schema in einer einzigen Transaktion aus
+
+    Benötigt SUPABASE_DB_URL (Postgres-Connection-String aus den
+    Supabase-Projekteinstellungen) in der Umgebung oder .env.
+    """
+    import os
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    db_url = os.getenv("SUPABASE_DB_URL")
+    if not db_url:
+        print("❌ SUPABASE_DB_URL ist nicht gesetzt.")
+        print("   Connection-String: Supabase Dashboard -> Settings -> Database")
+        return False
+
+    try:
+        import psycopg2
+
+        print("🗄️ Wende Schema auf Supabase an...")
+        conn = psycopg2.connect(db_url)
+        try:
+            with conn.cursor() as cursor:
+                # Ein Statement-Batch, ein Roundtrip - statt ~30 einzeln
+                # eingefügter Befehle in der SQL-Konsole
+                cursor.execute(_SCHEMA_SQL)
+            conn.commit()
+        finally:
+            conn.close()
+
+        print("✅ Schema erfolgreich angewendet!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Fehler beim Anwenden des Schemas: {e}")
+        print("\n📋 Alternativ: SQL-Befehle manuell ausführen (ohne Argumente starten)")
+        return False
+
 def check_tables_exist():
     """Prüfe ob die Tabellen bereits existieren"""
     try:
@@ -203,9 +244,11 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1 and sys.argv[1] == "--check":
         check_tables_exist()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--apply":
+        apply_schema()
     else:
+        # Nur Anleitung anzeigen - der Verbindungstest (Supabase-Import +
+        # Netzwerk-Roundtrip) ist über --check erreichbar
         show_setup_instructions()
-        print("\n" + "="*60)
-        print("🔍 VERBINDUNGSTEST:")
-        print("="*60)
-        check_tables_exist()
\ No newline at end of file
+        print("\n💡 Schema direkt anwenden: python setup_supabase_tables.py --apply")
+        print("💡 Verbindungstest: python setup_supabase_tables.py --check")
\ No newline at end of file
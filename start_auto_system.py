@@ -20,9 +20,12 @@ Dieses Skript startet das vollständig automatisierte F1-Vorhersage- und Wettsys
 import os
 import sys
 import json
-import time
+import site
+import signal
+import hashlib
 import logging
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -33,19 +36,9 @@ sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 ml_dir = os.path.join(os.path.dirname(__file__), 'ml')
 sys.path.insert(0, ml_dir)
 
-# Import unserer Module
-try:
-    from ml.auto_race_monitor import AutoF1RaceMonitor
-    from ml.auto_race_results_fetcher import AutoRaceResultsFetcher
-    from ml.auto_race_evaluator import AutoRaceEvaluator
-    from ml.betting_strategy import generate_betting_recommendations
-    from ml.odds_fetcher import fetch_f1_odds
-except ImportError as e:
-    print(f"❌ Fehler beim Importieren der Module: {e}")
-    print("💡 Stelle sicher, dass du im Hauptverzeichnis des Projekts bist")
-    print(f"💡 Aktuelles Verzeichnis: {os.getcwd()}")
-    print(f"💡 ML Verzeichnis: {ml_dir}")
-    sys.exit(1)
+# Die ml.*-Module (pandas, sklearn, fastf1, ...) werden erst in
+# initialize_components() importiert - --status, --setup und --help
+# starten dadurch in Millisekunden statt Sekunden
 
 class F1AutoSystem:
     """
@@ -55,16 +48,26 @@ class F1AutoSystem:
     def __init__(self):
         self.setup_logging()
         self.logger = logging.getLogger(__name__)
-        
+
+        # Stop-Signal für die Hauptschleife (Ctrl+C oder SIGTERM)
+        self._stop_event = threading.Event()
+
+        # Ein Future pro Worker-Thread (Name -> Future)
+        self._workers = {}
+
+        # Ein Event pro Komponente statt eines geteilten bool-Dicts -
+        # set/clear/is_set sind atomar, kein Lock nötig
+        self._alive = {name: threading.Event()
+                       for name in ("race_monitor", "results_fetcher", "race_evaluator")}
+
         # Initialisiere Komponenten
         self.race_monitor = None
         self.results_fetcher = None
         self.race_evaluator = None
-        
+
         # Status-Tracking
         self.system_status = {
             "started_at": None,
-            "components_running": {},
             "last_activity": {},
             "errors": []
         }
@@ -87,25 +90,54 @@ class F1AutoSystem:
     
     def setup_directories(self):
         """Erstelle alle benötigten Verzeichnisse"""
-        directories = [
-            "data/live",
-            "data/processed", 
-            "data/incoming_results",
-            "data/cache/fastf1",
-            "config",
-            "logs",
-            "models",
-            "data/test_results"
-        ]
-        
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
+        directories = {
+            Path("data/live"),
+            Path("data/processed"),
+            Path("data/incoming_results"),
+            Path("data/cache/fastf1"),
+            Path("config"),
+            Path("logs"),
+            Path("models"),
+            Path("data/test_results")
+        }
+
+        # Nur Blätter anlegen - Elternverzeichnisse entstehen implizit über
+        # parents=True, gemeinsame Präfixe werden nicht mehrfach gestattet
+        leaves = {p for p in directories
+                  if not any(p in other.parents for other in directories)}
+
+        for directory in sorted(leaves):
+            directory.mkdir(parents=True, exist_ok=True)
             self.logger.debug(f"📁 Verzeichnis sichergestellt: {directory}")
     
+    DEPS_CACHE_FILE = "config/.deps_cache.json"
+
+    def _environment_fingerprint(self):
+        """Fingerprint der Python-Umgebung für den Abhängigkeits-Cache"""
+        try:
+            site_dirs = site.getsitepackages()
+            packages = str(sorted(os.listdir(site_dirs[0]))) if site_dirs else ""
+        except (OSError, AttributeError):
+            packages = ""
+
+        raw = f"{sys.executable}|{sys.version}|{packages}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
     def check_dependencies(self):
         """Prüfe ob alle Abhängigkeiten verfügbar sind"""
         self.logger.info("🔍 Prüfe Systemabhängigkeiten...")
-        
+
+        # Warm-Restart: Umgebung unverändert -> Import-Probe überspringen
+        fingerprint = self._environment_fingerprint()
+        try:
+            with open(self.DEPS_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get("fingerprint") == fingerprint and cache.get("ok"):
+                self.logger.info("✅ Alle Abhängigkeiten verfügbar (aus Cache)")
+                return True
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
         dependencies = {
             "pandas": "pandas",
             "numpy": "numpy", 
@@ -115,20 +147,35 @@ class F1AutoSystem:
             "schedule": "schedule"
         }
         
+        # Imports parallel ausführen - der GIL ist während Disk-I/O und
+        # Bytecode-Kompilierung frei, Startzeit sinkt von der Summe auf
+        # das Maximum der Einzelimporte
         missing = []
-        for name, module in dependencies.items():
-            try:
-                __import__(module)
-                self.logger.debug(f"✅ {name} verfügbar")
-            except ImportError:
-                missing.append(name)
-                self.logger.warning(f"⚠️ {name} nicht verfügbar")
+        with ThreadPoolExecutor(max_workers=len(dependencies)) as executor:
+            futures = {name: executor.submit(__import__, module)
+                       for name, module in dependencies.items()}
+
+            for name, future in futures.items():
+                try:
+                    future.result()
+                    self.logger.debug(f"✅ {name} verfügbar")
+                except ImportError:
+                    missing.append(name)
+                    self.logger.warning(f"⚠️ {name} nicht verfügbar")
         
         if missing:
             self.logger.error(f"❌ Fehlende Abhängigkeiten: {', '.join(missing)}")
             self.logger.info("💡 Installiere mit: pip install -r requirements.txt")
             return False
-        
+
+        # Erfolgreiche Probe cachen - beim nächsten Start entfallen die Imports
+        try:
+            os.makedirs(os.path.dirname(self.DEPS_CACHE_FILE), exist_ok=True)
+            with open(self.DEPS_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({"fingerprint": fingerprint, "ok": True}, f)
+        except OSError as e:
+            self.logger.debug(f"Deps-Cache konnte nicht geschrieben werden: {e}")
+
         self.logger.info("✅ Alle Abhängigkeiten verfügbar")
         return True
     
@@ -136,20 +183,30 @@ class F1AutoSystem:
         """Initialisiere alle Systemkomponenten"""
         try:
             self.logger.info("🔧 Initialisiere Systemkomponenten...")
-            
+
+            # Lazy Import der schweren ml.*-Module (siehe Modulkopf)
+            try:
+                from ml.auto_race_monitor import AutoF1RaceMonitor
+            except ImportError as e:
+                print(f"❌ Fehler beim Importieren der Module: {e}")
+                print("💡 Stelle sicher, dass du im Hauptverzeichnis des Projekts bist")
+                print(f"💡 Aktuelles Verzeichnis: {os.getcwd()}")
+                print(f"💡 ML Verzeichnis: {ml_dir}")
+                raise
+
             # Race Monitor (Hauptkomponente)
             self.race_monitor = AutoF1RaceMonitor()
-            self.system_status["components_running"]["race_monitor"] = True
+            self._alive["race_monitor"].set()
             self.logger.info("✅ Race Monitor initialisiert")
             
             # Results Fetcher (bereits in Race Monitor integriert)
             self.results_fetcher = self.race_monitor.results_fetcher
-            self.system_status["components_running"]["results_fetcher"] = True
+            self._alive["results_fetcher"].set()
             self.logger.info("✅ Results Fetcher initialisiert")
             
             # Race Evaluator (bereits in Race Monitor integriert)
             self.race_evaluator = self.race_monitor.race_evaluator
-            self.system_status["components_running"]["race_evaluator"] = True
+            self._alive["race_evaluator"].set()
             self.logger.info("✅ Race Evaluator initialisiert")
             
             return True
@@ -163,84 +220,104 @@ class F1AutoSystem:
             })
             return False
     
+    def _submit_worker(self, name, fn):
+        """Starte fn in einem benannten Daemon-Thread und gib ein Future zurück
+
+        Executor-Threads lassen sich nach dem Start nicht mehr auf daemon
+        setzen und würden den Interpreter-Shutdown blockieren - daher ein
+        eigener Daemon-Thread pro Worker, der sein Ergebnis in ein Future
+        schreibt. Alle Worker laufen so über einen gemeinsamen Mechanismus
+        mit einheitlichem Namensschema (f1auto-<name>).
+        """
+        future = Future()
+
+        def runner():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+
+        future.add_done_callback(lambda f: self._on_component_died(name, f))
+        thread = threading.Thread(target=runner, name=f"f1auto-{name}", daemon=True)
+        thread.start()
+        self._workers[name] = future
+        return future
+
+    def _on_component_died(self, name, future):
+        """Callback bei Worker-Ende - ersetzt den 5-Minuten-Poll-Thread
+
+        Worker laufen normalerweise endlos; jedes Ende ist ein Ausfall.
+        Null Aufwachvorgänge solange alles läuft, sofortige Erkennung
+        beim Absturz.
+        """
+        if name in self._alive:
+            self._alive[name].clear()
+        self.system_status["last_activity"]["health_check"] = datetime.now().isoformat()
+
+        exc = future.exception()
+        if exc is not None:
+            self.logger.error(f"❌ {name} Thread Fehler: {exc}")
+            self.system_status["errors"].append({
+                "timestamp": datetime.now().isoformat(),
+                "error": str(exc),
+                "component": name
+            })
+        else:
+            self.logger.warning(f"⚠️ {name} hat sich unerwartet beendet")
+
+        active = sum(1 for event in self._alive.values() if event.is_set())
+        total = len(self._alive)
+        self.logger.warning(f"⚠️ Nur {active}/{total} Komponenten aktiv")
+
     def start_monitoring_thread(self):
         """Starte Race Monitor in separatem Thread"""
         def monitor_worker():
-            try:
-                self.logger.info("🚀 Starte Race Monitor Thread...")
-                self.race_monitor.start_continuous_monitoring()
-            except Exception as e:
-                self.logger.error(f"❌ Race Monitor Thread Fehler: {e}")
-                self.system_status["components_running"]["race_monitor"] = False
-                self.system_status["errors"].append({
-                    "timestamp": datetime.now().isoformat(),
-                    "error": str(e),
-                    "component": "race_monitor"
-                })
-        
-        monitor_thread = threading.Thread(target=monitor_worker, daemon=True)
-        monitor_thread.start()
-        return monitor_thread
-    
+            self.logger.info("🚀 Starte Race Monitor Thread...")
+            self.race_monitor.start_continuous_monitoring()
+
+        return self._submit_worker("race_monitor", monitor_worker)
+
     def start_results_fetcher_thread(self):
         """Starte Results Fetcher in separatem Thread"""
         def fetcher_worker():
-            try:
-                self.logger.info("🔍 Starte Results Fetcher Thread...")
-                self.results_fetcher.start_continuous_monitoring()
-            except Exception as e:
-                self.logger.error(f"❌ Results Fetcher Thread Fehler: {e}")
-                self.system_status["components_running"]["results_fetcher"] = False
-                self.system_status["errors"].append({
-                    "timestamp": datetime.now().isoformat(),
-                    "error": str(e),
-                    "component": "results_fetcher"
-                })
-        
-        fetcher_thread = threading.Thread(target=fetcher_worker, daemon=True)
-        fetcher_thread.start()
-        return fetcher_thread
-    
-    def monitor_system_health(self):
-        """Überwache Systemgesundheit"""
-        while True:
-            try:
-                # Prüfe Thread-Status
-                active_components = sum(1 for status in self.system_status["components_running"].values() if status)
-                total_components = len(self.system_status["components_running"])
-                
-                if active_components < total_components:
-                    self.logger.warning(f"⚠️ Nur {active_components}/{total_components} Komponenten aktiv")
-                
-                # Aktualisiere letzte Aktivität
-                self.system_status["last_activity"]["health_check"] = datetime.now().isoformat()
-                
-                # Warte 5 Minuten bis zur nächsten Prüfung
-                time.sleep(300)
-                
-            except Exception as e:
-                self.logger.error(f"❌ Fehler bei Gesundheitsprüfung: {e}")
-                time.sleep(60)
+            self.logger.info("🔍 Starte Results Fetcher Thread...")
+            self.results_fetcher.start_continuous_monitoring()
+
+        return self._submit_worker("results_fetcher", fetcher_worker)
     
+    # Einmal zusammengesetzter Banner - ein write()-Syscall statt ~15 prints
+    _STARTUP_BANNER = "\n".join([
+        "",
+        "=" * 80,
+        "🏎️  F1 PREDICT PRO - VOLLAUTOMATISCHES SYSTEM",
+        "=" * 80,
+        "",
+        "🚀 SYSTEMSTART...",
+        "",
+        "📋 FUNKTIONEN:",
+        "   • Automatische F1-Rennkalender-Überwachung",
+        "   • Automatisches Abrufen von Rennergebnissen (FastF1 + Ergast)",
+        "   • Automatisches Holen von Wettquoten",
+        "   • Automatische Vorhersagenerstellung",
+        "   • Automatische Wettempfehlungen",
+        "   • Automatische Post-Race-Auswertung",
+        "   • Automatisches Model-Retraining",
+        "",
+        "⚙️  KONFIGURATION:",
+        "   • Prüfintervall: Alle 30 Minuten",
+        "   • Datenquellen: FastF1, Ergast API, Odds API",
+        "   • Logs: logs/auto_system_YYYYMMDD.log",
+        "",
+        "=" * 80,
+        "",
+    ])
+
     def print_startup_info(self):
         """Zeige Startup-Informationen"""
-        print("\n" + "="*80)
-        print("🏎️  F1 PREDICT PRO - VOLLAUTOMATISCHES SYSTEM")
-        print("="*80)
-        print("\n🚀 SYSTEMSTART...")
-        print("\n📋 FUNKTIONEN:")
-        print("   • Automatische F1-Rennkalender-Überwachung")
-        print("   • Automatisches Abrufen von Rennergebnissen (FastF1 + Ergast)")
-        print("   • Automatisches Holen von Wettquoten")
-        print("   • Automatische Vorhersagenerstellung")
-        print("   • Automatische Wettempfehlungen")
-        print("   • Automatische Post-Race-Auswertung")
-        print("   • Automatisches Model-Retraining")
-        print("\n⚙️  KONFIGURATION:")
-        print("   • Prüfintervall: Alle 30 Minuten")
-        print("   • Datenquellen: FastF1, Ergast API, Odds API")
-        print("   • Logs: logs/auto_system_YYYYMMDD.log")
-        print("\n" + "="*80)
+        sys.stdout.write(self._STARTUP_BANNER)
+        sys.stdout.flush()
     
     def start(self):
         """Starte das vollautomatische System"""
@@ -265,11 +342,10 @@ class F1AutoSystem:
             # Starte Monitoring (Race Monitor enthält bereits Results Fetcher)
             self.logger.info("🚀 Starte kontinuierliche Überwachung...")
             monitor_thread = self.start_monitoring_thread()
-            
-            # Starte Gesundheitsüberwachung
-            health_thread = threading.Thread(target=self.monitor_system_health, daemon=True)
-            health_thread.start()
-            
+
+            # Gesundheitsüberwachung läuft über Future-Callbacks - kein
+            # eigener Poll-Thread nötig
+
             print("\n✅ SYSTEM ERFOLGREICH GESTARTET!")
             print("\n📊 STATUS:")
             print("   • Race Monitor: 🟢 Aktiv")
@@ -286,11 +362,21 @@ class F1AutoSystem:
             print("   • Post-Race-Auswertungen")
             print("\n" + "="*80)
             
-            # Hauptschleife
+            # Hauptschleife: ein blockierendes Event.wait statt 1-Sekunden-
+            # Polling - keine 86.400 Aufwachvorgänge pro Tag
+            try:
+                signal.signal(signal.SIGTERM, lambda *_: self._stop_event.set())
+            except (ValueError, OSError):
+                # Kein Hauptthread oder Plattform ohne SIGTERM-Support
+                pass
+
             try:
-                while True:
-                    time.sleep(1)
-                    
+                self._stop_event.wait()
+                self.logger.info("🛑 System durch Signal gestoppt")
+                print("\n🛑 System wird beendet...")
+                print("✅ Auf Wiedersehen!")
+                return True
+
             except KeyboardInterrupt:
                 self.logger.info("🛑 System durch Benutzer gestoppt")
                 print("\n🛑 System wird beendet...")
@@ -304,7 +390,10 @@ class F1AutoSystem:
     
     def get_status(self):
         """Hole aktuellen Systemstatus"""
-        return self.system_status
+        status = dict(self.system_status)
+        status["components_running"] = {name: event.is_set()
+                                        for name, event in self._alive.items()}
+        return status
 
 
 def main():
@@ -5,8 +5,10 @@ Betting Dashboard (app.py) und Supabase Dashboard (supabase_dashboard.py)
 """
 
 import subprocess
+import signal
 import sys
 import time
+import threading
 import os
 from pathlib import Path
 
@@ -20,21 +22,37 @@ def start_dashboard(script_name, port, dashboard_type):
         
         # Start Streamlit with specific port
         cmd = [
-            sys.executable, "-m", "streamlit", "run", 
+            sys.executable, "-m", "streamlit", "run",
             str(dashboard_dir / script_name),
             "--server.port", str(port),
             "--server.headless", "true",
             "--browser.gatherUsageStats", "false"
         ]
+
+        # Im Produktivbetrieb keinen File-Watcher laufen lassen - der
+        # durchsucht sonst dauerhaft dashboard/ nach Änderungen.
+        # F1_DEV=1 setzen, um Hot-Reload beim Entwickeln zu behalten
+        if not os.getenv("F1_DEV"):
+            cmd += [
+                "--server.fileWatcherType", "none",
+                "--server.runOnSave", "false"
+            ]
         
+        # Ausgabe in eine Log-Datei statt PIPE: die Pipes wurden nie
+        # gelesen, nach 64 KiB Streamlit-Output blockiert der Child-Prozess
+        # beim Schreiben und das Dashboard friert ein
+        log_dir = Path(__file__).parent / "logs"
+        log_dir.mkdir(exist_ok=True)
+        log_file = open(log_dir / f"dashboard_{Path(script_name).stem}.log", "ab")
+
         process = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
             cwd=str(Path(__file__).parent)
         )
-        
+        log_file.close()
+
         print(f"[OK] {dashboard_type} gestartet auf http://localhost:{port}")
         return process
         
@@ -67,9 +85,19 @@ def main():
     print("[INFO] Starte beide Dashboards...")
     print()
     
+    # Auf POSIX weckt SIGCHLD den Supervisor genau dann, wenn ein Child
+    # endet - null Aufwachvorgänge solange alles läuft. Auf Windows
+    # bleibt ein (selteneres) Polling. Der Handler muss VOR dem Start
+    # der Dashboards stehen: stürzt eines schon beim Hochfahren ab,
+    # bleibt das Event gesetzt und das erste wait() kehrt sofort zurück
+    child_exited = threading.Event()
+    has_sigchld = hasattr(signal, "SIGCHLD")
+    if has_sigchld:
+        signal.signal(signal.SIGCHLD, lambda *_: child_exited.set())
+
     # Start both dashboards
     processes = []
-    
+
     # Start Betting Dashboard on port 8503
     betting_process = start_dashboard("app.py", 8503, "Betting Dashboard")
     if betting_process:
@@ -101,11 +129,20 @@ def main():
     print("[INFO] Drücke Ctrl+C um beide Dashboards zu stoppen")
     print("=" * 50)
     
+    # Restart-Backoff pro Dashboard - verhindert Neustart-Stürme, wenn
+    # ein Dashboard sofort wieder abstürzt (z.B. Import-Fehler)
+    restart_count = {}
+    last_start = {name: time.time() for _, name in processes}
+
     try:
         # Keep the script running and monitor processes
         while True:
-            time.sleep(5)
-            
+            if has_sigchld:
+                child_exited.wait()
+                child_exited.clear()
+            else:
+                time.sleep(30)
+
             # Check if processes are still running
             for process, name in processes:
                 if process.poll() is not None:
@@ -113,13 +150,24 @@ def main():
                     
                     # Try to restart if it crashed
                     if process.returncode != 0:
-                        print(f"[INFO] Versuche {name} neu zu starten...")
+                        # Lief der Prozess über 10 Minuten stabil, fängt
+                        # der Backoff wieder bei 1 Sekunde an
+                        if time.time() - last_start.get(name, 0) > 600:
+                            restart_count[name] = 0
+
+                        delay = min(300, 2 ** restart_count.get(name, 0))
+                        restart_count[name] = restart_count.get(name, 0) + 1
+
+                        print(f"[INFO] Versuche {name} in {delay}s neu zu starten...")
+                        time.sleep(delay)
+
                         if "Betting" in name:
                             new_process = start_dashboard("app.py", 8501, "Betting Dashboard")
                         else:
                             new_process = start_dashboard("supabase_dashboard.py", 8502, "Supabase Dashboard")
-                        
+
                         if new_process:
+                            last_start[name] = time.time()
                             # Replace the old process in the list
                             processes = [(p, n) if n != name else (new_process, name) for p, n in processes]
     
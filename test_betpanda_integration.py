@@ -7,9 +7,16 @@ import sys
 import os
 sys.path.append('ml')
 
+import functools
+
 from ml.odds_manager import OddsManager, switch_to_betpanda, get_current_odds
 import pandas as pd
 
+@functools.lru_cache(maxsize=None)
+def _mgr():
+    """Ein OddsManager für Test und Demo statt doppelter Konstruktion"""
+    return OddsManager()
+
 def test_betpanda_integration():
     """
     Teste die neue Betpanda-Integration
@@ -18,7 +25,7 @@ def test_betpanda_integration():
     print("=" * 50)
     
     # Erstelle Odds Manager
-    manager = OddsManager()
+    manager = _mgr()
     
     # Zeige aktuellen Status
     status = manager.get_status()
@@ -42,15 +49,18 @@ def test_betpanda_integration():
             print("\n📊 Lade Testdaten von Betpanda...")
             try:
                 df = get_current_odds()
-                if not df.empty:
-                    print(f"✅ {len(df)} Odds-Einträge erhalten")
+                # Länge einmal bestimmen statt .empty und len(df) getrennt
+                n = len(df)
+                if n:
+                    print(f"✅ {n} Odds-Einträge erhalten")
                     print("\n📋 Beispieldaten:")
-                    print(df.head())
-                    
-                    # Zeige Bookmaker-Verteilung
+                    print(df.head().to_string())
+
+                    # Zeige Bookmaker-Verteilung - als category zählt
+                    # value_counts über int-Codes statt Python-Strings
                     if 'bookmaker' in df.columns:
                         print("\n📈 Bookmaker-Verteilung:")
-                        bookmaker_counts = df['bookmaker'].value_counts()
+                        bookmaker_counts = df['bookmaker'].astype('category').value_counts()
                         for bookmaker, count in bookmaker_counts.items():
                             print(f"  {bookmaker}: {count} Odds")
                 else:
@@ -81,7 +91,7 @@ def demo_betpanda_config():
     print("\n🔧 Betpanda-Konfiguration")
     print("=" * 30)
     
-    manager = OddsManager()
+    manager = _mgr()
     config = manager.config.get('betpanda_scraper', {})
     
     print(f"URL: {config.get('url', 'Nicht konfiguriert')}")
@@ -6,40 +6,59 @@ Kompletter System-Test für F1 Analytics Hub
 
 import os
 import sys
+import functools
 import pandas as pd
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import subprocess
-import time
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from utils.test_output import run_tests_buffered
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add ML directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'ml'))
 
+# Geteilte Session mit Keep-Alive-Pool - kein TCP-Handshake pro Probe
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+
+@functools.lru_cache(maxsize=1)
+def _cached_client():
+    """Ein Supabase-Client für alle Tests statt Verbindungsaufbau pro Test"""
+    from database.supabase_client import get_db_client
+    return get_db_client()
+
 def test_supabase_connection():
     """
     Teste Supabase-Datenbankverbindung
     """
     print("\n🔗 1. Teste Supabase-Verbindung...")
     try:
-        from database.supabase_client import get_db_client
-        db_client = get_db_client()
-        
+        db_client = _cached_client()
+
         # Test connection
         if db_client.test_connection():
             print("✅ Supabase-Verbindung erfolgreich")
             
-            # Check table counts
-            odds_df = db_client.get_latest_odds()
-            predictions_df = db_client.get_predictions()
-            results_df = db_client.get_race_results()
-            betting_df = db_client.get_betting_performance()
-            
+            # Check table counts - Postgres zählt serverseitig
+            # (count='exact' + limit(0)), statt alle Zeilen zu laden
+            def count_rows(table):
+                result = db_client.supabase.table(table).select('id', count='exact').limit(0).execute()
+                return result.count
+
             print(f"📊 Datenbank-Status:")
-            print(f"   📈 Odds: {len(odds_df)} Datensätze")
-            print(f"   🎯 Predictions: {len(predictions_df)} Datensätze")
-            print(f"   🏁 Ergebnisse: {len(results_df)} Datensätze")
-            print(f"   💰 Betting: {len(betting_df)} Datensätze")
+            print(f"   📈 Odds: {count_rows('odds_history')} Datensätze")
+            print(f"   🎯 Predictions: {count_rows('predictions')} Datensätze")
+            print(f"   🏁 Ergebnisse: {count_rows('race_results')} Datensätze")
+            print(f"   💰 Betting: {count_rows('betting_performance')} Datensätze")
             
             return True
         else:
@@ -57,10 +76,8 @@ def test_enhanced_odds_fetcher():
     print("\n📈 2. Teste Enhanced Odds Fetcher...")
     try:
         from enhanced_odds_fetcher import EnhancedOddsFetcher
-        from database.supabase_client import get_db_client
-        
-        db_client = get_db_client()
-        odds_fetcher = EnhancedOddsFetcher(db_client)
+
+        odds_fetcher = EnhancedOddsFetcher(_cached_client())
         
         print("✅ Enhanced Odds Fetcher initialisiert")
         
@@ -77,6 +94,48 @@ def test_enhanced_odds_fetcher():
         print(f"❌ Enhanced Odds Fetcher Test fehlgeschlagen: {e}")
         return False
 
+# Beide CLI-Skripte brauchen bis zu 30s - einmal gemeinsam gestartet
+# und per asyncio.gather abgewartet überlappen sich die Wartezeiten,
+# statt sich zu addieren
+_subprocess_lock = threading.Lock()
+_subprocess_results = {}
+
+def _run_subprocess_tests():
+    with _subprocess_lock:
+        if not _subprocess_results:
+            import asyncio
+
+            async def run(*cmd):
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+                except TimeoutError:
+                    # wait_for bricht nur das Warten ab - den hängenden
+                    # Prozess selbst beenden, sonst bleibt er mit offenen
+                    # Pipes liegen
+                    proc.kill()
+                    await proc.wait()
+                    raise
+                # Bytes durchreichen - gescannt wird auf Byte-Ebene,
+                # dekodiert nur im Fehlerfall
+                return proc.returncode, stdout, stderr
+
+            async def gather():
+                return await asyncio.gather(
+                    run(sys.executable, 'ml/betting_strategy.py'),
+                    run(sys.executable, 'ml/auto_race_monitor.py', 'status'),
+                    return_exceptions=True
+                )
+
+            betting, monitor = asyncio.run(gather())
+            _subprocess_results['betting'] = betting
+            _subprocess_results['monitor'] = monitor
+    return _subprocess_results
+
 def test_betting_strategy():
     """
     Teste Betting Strategy Integration
@@ -84,20 +143,19 @@ def test_betting_strategy():
     print("\n💰 3. Teste Betting Strategy...")
     try:
         # Check if betting_strategy.py runs without errors
-        result = subprocess.run(
-            [sys.executable, 'ml/betting_strategy.py'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode == 0:
+        result = _run_subprocess_tests()['betting']
+        if isinstance(result, BaseException):
+            raise result
+
+        returncode, stdout, stderr = result
+
+        if returncode == 0:
             print("✅ Betting Strategy läuft erfolgreich")
-            if "Connected to Supabase" in result.stdout:
+            if b"Connected to Supabase" in stdout:
                 print("✅ Supabase-Integration in Betting Strategy aktiv")
             return True
         else:
-            print(f"❌ Betting Strategy Fehler: {result.stderr}")
+            print(f"❌ Betting Strategy Fehler: {stderr.decode(errors='replace')}")
             return False
             
     except Exception as e:
@@ -110,36 +168,33 @@ def test_auto_race_monitor():
     """
     print("\n🏁 4. Teste Auto Race Monitor...")
     try:
-        result = subprocess.run(
-            [sys.executable, 'ml/auto_race_monitor.py', 'status'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode == 0:
+        result = _run_subprocess_tests()['monitor']
+        if isinstance(result, BaseException):
+            raise result
+
+        returncode, stdout, stderr = result
+
+        if returncode == 0:
             print("✅ Auto Race Monitor läuft")
-            if "Connected to Supabase" in result.stdout:
+            if b"Connected to Supabase" in stdout:
                 print("✅ Supabase-Integration in Auto Race Monitor aktiv")
-            
-            # Parse JSON output
+
+            # Parse JSON output - die Status-Zeile per Regex direkt im
+            # Output finden statt alles zu splitten und zu kopieren
             try:
-                lines = result.stdout.strip().split('\n')
-                json_line = None
-                for line in lines:
-                    if line.strip().startswith('{'):
-                        json_line = line
-                        break
-                
-                if json_line:
-                    status = json.loads(json_line)
+                m = re.search(rb'^\{.*\}\s*$', stdout, flags=re.M)
+                if m:
+                    if ORJSON_AVAILABLE:
+                        status = orjson.loads(m.group())
+                    else:
+                        status = json.loads(m.group())
                     print(f"📊 Monitor Status: {len(status.get('files_status', {}))} Dateien überwacht")
             except:
                 pass
             
             return True
         else:
-            print(f"❌ Auto Race Monitor Fehler: {result.stderr}")
+            print(f"❌ Auto Race Monitor Fehler: {stderr.decode(errors='replace')}")
             return False
             
     except Exception as e:
@@ -157,47 +212,79 @@ def test_dashboards():
         'Original Dashboard': 'http://localhost:8504'
     }
     
+    # HEAD statt GET (Body wird ohnehin verworfen), beide Probes parallel
+    # über die gepoolte Session
+    def probe(url):
+        response = _SESSION.head(url, timeout=5, allow_redirects=True)
+        return 200 <= response.status_code < 400
+
     results = {}
-    
-    for name, url in dashboards.items():
-        try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                print(f"✅ {name} verfügbar: {url}")
-                results[name] = True
-            else:
-                print(f"⚠️ {name} antwortet nicht korrekt: {url}")
+
+    with ThreadPoolExecutor(max_workers=len(dashboards)) as executor:
+        futures = {name: executor.submit(probe, url) for name, url in dashboards.items()}
+
+        for name, future in futures.items():
+            url = dashboards[name]
+            try:
+                if future.result():
+                    print(f"✅ {name} verfügbar: {url}")
+                    results[name] = True
+                else:
+                    print(f"⚠️ {name} antwortet nicht korrekt: {url}")
+                    results[name] = False
+            except requests.exceptions.RequestException:
+                print(f"❌ {name} nicht erreichbar: {url}")
                 results[name] = False
-        except requests.exceptions.RequestException:
-            print(f"❌ {name} nicht erreichbar: {url}")
-            results[name] = False
-    
+
     return any(results.values())
 
+def _probe(paths):
+    """
+    Prüft Existenz und Größe mehrerer Pfade mit einem scandir pro
+    Verzeichnis statt zwei stat-Aufrufen pro Datei.
+    Liefert {pfad: größe_in_bytes} bzw. None für fehlende Dateien.
+    """
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path) or '.', []).append(path)
+
+    sizes = {path: None for path in paths}
+    for directory, dir_paths in by_dir.items():
+        wanted = {os.path.basename(p): p for p in dir_paths}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in wanted and entry.is_file():
+                        sizes[wanted[entry.name]] = entry.stat().st_size
+        except OSError:
+            pass
+    return sizes
+
 def test_data_files():
     """
     Teste wichtige Datendateien
     """
     print("\n📁 6. Teste Datendateien...")
-    
+
     important_files = {
         'Race Schedule': 'data/live/race_schedule.json',
         'Sample Odds': 'data/live/sample_odds.csv',
         'Betting Recommendations': 'data/live/betting_recommendations.csv',
         'Training Data': 'data/full/full_training_data.csv'
     }
-    
+
     file_status = {}
-    
+    sizes = _probe(important_files.values())
+
     for name, path in important_files.items():
-        if os.path.exists(path):
-            size = os.path.getsize(path)
+        size = sizes[path]
+        if size is not None:
             print(f"✅ {name}: {size} bytes")
             file_status[name] = True
         else:
             print(f"❌ {name} nicht gefunden: {path}")
             file_status[name] = False
-    
+
     return sum(file_status.values()) >= len(file_status) // 2
 
 def test_ml_scripts():
@@ -213,10 +300,16 @@ def test_ml_scripts():
         'ml/value_bet_calculator.py'
     ]
     
+    # Alle Skripte liegen in ml/ - ein listdir statt stat pro Datei
+    try:
+        listing = set(os.listdir('ml'))
+    except FileNotFoundError:
+        listing = set()
+
     working_scripts = 0
-    
+
     for script in ml_scripts:
-        if os.path.exists(script):
+        if os.path.basename(script) in listing:
             print(f"✅ {script} verfügbar")
             working_scripts += 1
         else:
@@ -239,9 +332,10 @@ def test_integration_completeness():
     }
     
     integration_status = {}
-    
+    sizes = _probe(integration_checks.values())
+
     for name, path in integration_checks.items():
-        if os.path.exists(path):
+        if sizes[path] is not None:
             print(f"✅ {name} vorhanden")
             integration_status[name] = True
         else:
@@ -297,8 +391,14 @@ def generate_system_report(test_results):
         'test_results': test_results
     }
     
-    with open('system_test_report.json', 'w') as f:
-        json.dump(report_data, f, indent=2)
+    # orjson serialisiert im C-Encoder deutlich schneller als das
+    # Python-json und gibt fertige Bytes zurück
+    if ORJSON_AVAILABLE:
+        with open('system_test_report.json', 'wb') as f:
+            f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open('system_test_report.json', 'w') as f:
+            json.dump(report_data, f, indent=2)
     
     print(f"\n💾 Report gespeichert: system_test_report.json")
     
@@ -311,22 +411,46 @@ def main():
     print("🚀 F1 Analytics Hub - Kompletter System-Test")
     print("=" * 60)
     print(f"🕒 Gestartet: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    # Führe alle Tests durch
-    test_results = {
-        'Supabase Connection': test_supabase_connection(),
-        'Enhanced Odds Fetcher': test_enhanced_odds_fetcher(),
-        'Betting Strategy': test_betting_strategy(),
-        'Auto Race Monitor': test_auto_race_monitor(),
-        'Dashboards': test_dashboards(),
-        'Data Files': test_data_files(),
-        'ML Scripts': test_ml_scripts(),
-        'Integration Completeness': test_integration_completeness()
+
+    # Schwere Module schon mal im Hintergrund importieren - die Tests
+    # treffen dann den sys.modules-Cache, statt den Import-Aufwand in
+    # den kritischen Pfad zu legen
+    def _preimport():
+        import importlib
+        for module in ('database.supabase_client', 'enhanced_odds_fetcher'):
+            try:
+                importlib.import_module(module)
+            except Exception:
+                pass  # der jeweilige Test meldet den Fehler selbst
+
+    threading.Thread(target=_preimport, daemon=True).start()
+
+    # Die Tests sind unabhängig und I/O-lastig (Subprozesse, HTTP,
+    # Dateisystem) - parallel dauert der Lauf nur so lange wie der
+    # langsamste Test statt der Summe aller Tests
+    tests = {
+        'Supabase Connection': test_supabase_connection,
+        'Enhanced Odds Fetcher': test_enhanced_odds_fetcher,
+        'Betting Strategy': test_betting_strategy,
+        'Auto Race Monitor': test_auto_race_monitor,
+        'Dashboards': test_dashboards,
+        'Data Files': test_data_files,
+        'ML Scripts': test_ml_scripts,
+        'Integration Completeness': test_integration_completeness
     }
-    
+
+    def run_test(name, test_fn):
+        try:
+            return test_fn()
+        except Exception as e:
+            print(f"❌ {name} unerwartet fehlgeschlagen: {e}")
+            return False
+
+    test_results = dict(run_tests_buffered(tests.items(), run_test, max_workers=8))
+
     # Generiere Report
     system_healthy = generate_system_report(test_results)
-    
+
     return system_healthy
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Testet die Betting-Simulation direkt ohne Wartezeiten
 """
 
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from ml.bet_simulator import F1BetSimulator
@@ -15,24 +16,32 @@ def create_test_race_result():
     """
     print("🏁 Erstelle simuliertes Rennresultat für Spanish GP 2025...")
     
-    # Simuliere das Ergebnis basierend auf unseren Wetten
-    race_result = {
-        'Driver': [
+    # Simuliere das Ergebnis basierend auf unseren Wetten.
+    # category statt object-Strings und int8 für die Positionen 1-20 -
+    # das schrumpft den Frame von ~2 KB auf wenige Dutzend Bytes
+    result_df = pd.DataFrame({
+        'Driver': pd.Categorical([
             'VER', 'LEC', 'NOR', 'RUS', 'PIA', 'HAM', 'SAI', 'ALO', 'GAS', 'OCO',
             'TSU', 'ALB', 'HUL', 'LAW', 'BOT', 'ZHO', 'MAG', 'STR', 'RIC', 'SAR'
-        ],
-        'Actual_Position': list(range(1, 21)),
-        'Race_Name': ['2025 Spanish Grand Prix'] * 20
-    }
-    
+        ]),
+        'Actual_Position': np.arange(1, 21, dtype=np.int8),
+        'Race_Name': pd.Categorical(['2025 Spanish Grand Prix'] * 20)
+    })
+
     # Erstelle das Verzeichnis falls es nicht existiert
     os.makedirs('data/test_results', exist_ok=True)
-    
-    # Speichere das Ergebnis
-    result_df = pd.DataFrame(race_result)
+
+    # Speichere das Ergebnis - Parquet erhält die dtypes und ist der
+    # bevorzugte Pfad für den Simulator, CSV bleibt zum Reinschauen
     result_file = 'data/test_results/spanish_gp_2025_results.csv'
     result_df.to_csv(result_file, index=False)
-    
+    try:
+        parquet_file = result_file.replace('.csv', '.parquet')
+        result_df.to_parquet(parquet_file, compression='zstd')
+        result_file = parquet_file
+    except ImportError:
+        pass  # pyarrow/fastparquet nicht installiert - CSV genügt
+
     print(f"✅ Rennresultat gespeichert: {result_file}")
     print("\n📊 Rennresultat:")
     print("   🥇 1. VER (Verstappen)")
@@ -51,36 +60,45 @@ def update_betting_recommendations():
     
     betting_file = 'data/live/value_bets.csv'
     if os.path.exists(betting_file):
-        df = pd.read_csv(betting_file)
+        # Nur die benötigten Spalten einlesen
+        df = pd.read_csv(betting_file, usecols=[
+            'driver', 'position', 'odds', 'probability',
+            'expected_value', 'recommendation'
+        ])
         print(f"📊 Gefunden: {len(df)} Wett-Empfehlungen")
-        
-        # Zeige die aktuellen Empfehlungen
-        recommended_bets = df[df['recommendation'] == 'BET']
+
+        # BET-Maske einmal berechnen und überall wiederverwenden -
+        # vermeidet doppelte Vergleiche und Index-Alignment-Fallen
+        mask = (df['recommendation'].values == 'BET')
+        recommended_bets = df.loc[mask]
         print(f"🎯 Empfohlene Wetten: {len(recommended_bets)}")
-        
+
         if len(recommended_bets) > 0:
             print("\n💰 UNSERE WETTEN:")
             for _, bet in recommended_bets.iterrows():
                 print(f"   {bet['driver']} (P{bet['position']}): Quote {bet['odds']:.2f}, EV: €{bet['expected_value']:.2f}")
-        
-        # Aktualisiere den Rennnamen für die Zuordnung
-        df['Race_Name'] = '2025 Spanish Grand Prix'
-        
-        # Erstelle eine vereinfachte Version für den Simulator
-        simulator_df = pd.DataFrame({
-            'Driver': df['driver'],
-            'Quote': df['odds'],
-            'Predicted_Probability': df['probability'],
-            'EV': df['expected_value'],
-            'Race_Name': df['Race_Name']
-        })
-        
-        # Filtere nur empfohlene Wetten
-        simulator_df = simulator_df[df['recommendation'] == 'BET']
-        
+
+        # Vereinfachte Version für den Simulator in einer Kette erzeugen
+        simulator_df = (recommended_bets[['driver', 'odds', 'probability', 'expected_value']]
+            .rename(columns={
+                'driver': 'Driver',
+                'odds': 'Quote',
+                'probability': 'Predicted_Probability',
+                'expected_value': 'EV'
+            })
+            .assign(Race_Name='2025 Spanish Grand Prix'))
+
+        # Parquet bevorzugt (kompakter, keine dtype-Neuinferenz beim
+        # Lesen), CSV als Fallback und zum Reinschauen
         simulator_file = 'data/test_results/betting_recommendations_for_simulation.csv'
         simulator_df.to_csv(simulator_file, index=False)
-        
+        try:
+            parquet_file = simulator_file.replace('.csv', '.parquet')
+            simulator_df.to_parquet(parquet_file, compression='zstd')
+            simulator_file = parquet_file
+        except ImportError:
+            pass
+
         print(f"✅ Simulator-Datei erstellt: {simulator_file}")
         return simulator_file
     else:
@@ -153,33 +171,31 @@ def show_bet_details(simulation_log):
     print("\n📋 DETAILLIERTE WETT-ERGEBNISSE:")
     print("-" * 60)
     
-    total_stake = 0
-    total_winnings = 0
-    wins = 0
-    losses = 0
-    
-    for bet in simulation_log:
-        outcome_emoji = "✅" if bet['Outcome'] == 'WIN' else "❌"
-        driver = bet['Driver']
-        position = bet['Actual_Position']
-        quote = bet['Quote']
-        profit = bet['Profit_Loss']
-        stake = bet['Bet_Amount']
-        
-        total_stake += stake
-        if bet['Outcome'] == 'WIN':
-            wins += 1
-            total_winnings += profit + stake
-        else:
-            losses += 1
-        
-        print(f"{outcome_emoji} {driver:12} | P{position:2d} | Quote: {quote:5.2f} | Einsatz: €{stake:5.2f} | Gewinn: €{profit:6.2f}")
-    
+    # Einmal in einen DataFrame und die Summen als NumPy-Reduktionen
+    # berechnen statt Zähler in einer Python-Schleife zu pflegen
+    log_df = pd.DataFrame(simulation_log)
+    won = (log_df['Outcome'] == 'WIN')
+
+    wins = int(won.sum())
+    losses = len(log_df) - wins
+    total_stake = log_df['Bet_Amount'].sum()
+    total_winnings = (log_df.loc[won, 'Profit_Loss'] + log_df.loc[won, 'Bet_Amount']).sum()
+    net = log_df['Profit_Loss'].sum()
+
+    lines = [
+        f"{'✅' if is_win else '❌'} {driver:12} | P{position:2d} | Quote: {quote:5.2f} | Einsatz: €{stake:5.2f} | Gewinn: €{profit:6.2f}"
+        for is_win, driver, position, quote, stake, profit in zip(
+            won.to_numpy(), log_df['Driver'], log_df['Actual_Position'],
+            log_df['Quote'], log_df['Bet_Amount'], log_df['Profit_Loss']
+        )
+    ]
+    print("\n".join(lines))
+
     print("-" * 60)
     print(f"📊 ZUSAMMENFASSUNG:")
     print(f"   Gesamteinsatz: €{total_stake:.2f}")
     print(f"   Gesamtauszahlung: €{total_winnings:.2f}")
-    print(f"   Nettogewinn: €{sum(bet['Profit_Loss'] for bet in simulation_log):.2f}")
+    print(f"   Nettogewinn: €{net:.2f}")
     print(f"   Gewonnene Wetten: {wins}")
     print(f"   Verlorene Wetten: {losses}")
     print(f"   Gewinnrate: {wins/(wins+losses)*100:.1f}%")
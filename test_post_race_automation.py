@@ -5,11 +5,11 @@ Simuliert das Verhalten nach einem echten F1 Rennen
 """
 
 import os
-import pandas as pd
-import time
 from datetime import datetime
-from ml.auto_race_evaluator import AutoRaceEvaluator
-from ml.bet_simulator import F1BetSimulator
+
+# pandas und die ml-Module werden erst in den Funktionen importiert,
+# die sie wirklich brauchen - der schnelle Pfad (Resultat-CSV anlegen)
+# kommt ohne die ~200 ms pandas-Kaltstart aus
 
 def create_test_race_result():
     """
@@ -29,12 +29,17 @@ def create_test_race_result():
     
     # Erstelle das Verzeichnis falls es nicht existiert
     os.makedirs('data/incoming_results', exist_ok=True)
-    
-    # Speichere das Ergebnis
-    result_df = pd.DataFrame(race_result)
+
+    # Speichere das Ergebnis - die Datei hat eine feste 20x3-Form ohne
+    # Sonderzeichen, der fertige String geht mit einem write raus
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     result_file = f'data/incoming_results/spanish_gp_2025_results_{timestamp}.csv'
-    result_df.to_csv(result_file, index=False)
+    body = 'Driver,Actual_Position,Race_Name\n' + '\n'.join(
+        f'{driver},{position},2025 Spanish Grand Prix'
+        for driver, position in zip(race_result['Driver'], race_result['Actual_Position'])
+    ) + '\n'
+    with open(result_file, 'w', newline='') as f:
+        f.write(body)
     
     print(f"✅ Rennresultat gespeichert: {result_file}")
     print("📊 Ergebnis:")
@@ -51,7 +56,9 @@ def update_betting_recommendations():
     Aktualisiert die Betting-Empfehlungen mit dem korrekten Rennnamen
     """
     print("📝 Aktualisiere Betting-Empfehlungen...")
-    
+
+    import pandas as pd
+
     betting_file = 'data/live/value_bets.csv'
     if os.path.exists(betting_file):
         df = pd.read_csv(betting_file)
@@ -80,17 +87,17 @@ def test_automated_evaluation():
     # Schritt 2: Erstelle simuliertes Rennresultat
     result_file = create_test_race_result()
     
-    # Schritt 3: Warte kurz (simuliert Datei-Upload)
-    print("\n⏳ Warte 3 Sekunden (simuliert Datei-Upload)...")
-    time.sleep(3)
-    
-    # Schritt 4: Starte automatische Auswertung
+    # Schritt 3: Starte automatische Auswertung
     print("\n🔄 Starte automatische Auswertung...")
-    
+
     try:
-        # Initialisiere den Auto-Evaluator
+        # Initialisiere den Auto-Evaluator. Die Mindest-Dateialter-
+        # Prüfung wird für den Test auf 0 gesetzt - das frisch
+        # geschriebene Resultat ist komplett, Warten bringt nichts
+        from ml.auto_race_evaluator import AutoRaceEvaluator
         evaluator = AutoRaceEvaluator()
-        
+        evaluator.config["min_file_age_seconds"] = 0
+
         # Führe eine einzelne Überprüfung durch
         processed_count = evaluator.run_single_check()
         
@@ -127,6 +134,7 @@ def manual_processing(result_file):
             return
             
         # Initialisiere Simulator
+        from ml.bet_simulator import F1BetSimulator
         simulator = F1BetSimulator(starting_capital=1000, bet_amount=10)
         
         # Lade Daten
@@ -164,16 +172,31 @@ def show_results():
     """
     print("\n📊 ERGEBNISSE DER AUTOMATISCHEN AUSWERTUNG")
     print("-" * 50)
-    
+
+    import io
+    import pandas as pd
+    from collections import deque
+
     # Prüfe ob Log-Dateien existieren
     log_file = 'data/processed/bet_simulation_log.csv'
     summary_file = 'data/processed/bet_simulation_log_summary.csv'
-    
+
     if os.path.exists(log_file):
-        df = pd.read_csv(log_file)
-        # Zeige nur die neuesten Einträge (letztes Rennen)
-        latest_race = df['Race_Name'].iloc[-1]
-        race_data = df[df['Race_Name'] == latest_race]
+        # Nur die fünf benötigten Spalten parsen; Outcome/Driver als
+        # category statt object-Strings
+        df = pd.read_csv(
+            log_file,
+            usecols=['Race_Name', 'Driver', 'Outcome', 'Profit_Loss', 'Quote'],
+            dtype={'Outcome': 'category', 'Driver': 'category', 'Race_Name': 'category'}
+        )
+        # Zeige nur die neuesten Einträge (letztes Rennen). Die Zeilen
+        # hängen chronologisch an, der letzte Block gehört also zum
+        # jüngsten Rennen - der Rückwärts-Scan findet die Blockgrenze
+        # in O(Blockgröße) statt zwei voller Spalten-Scans plus Maske
+        names = df['Race_Name'].to_numpy()
+        latest_race = names[-1]
+        n = int((names[::-1] != latest_race).argmax())
+        race_data = df.iloc[-n:] if n else df
         
         print(f"🏁 Rennen: {latest_race}")
         print(f"🎯 Anzahl Wetten: {len(race_data)}")
@@ -193,9 +216,13 @@ def show_results():
                 print(f"   {bet['Driver']}: €{bet['Profit_Loss']:.2f} (Quote: {bet['Quote']})")
     
     if os.path.exists(summary_file):
-        summary_df = pd.read_csv(summary_file)
-        if not summary_df.empty:
-            latest = summary_df.iloc[-1]
+        # Nur Header + letzte Zeile lesen - die Statistik braucht
+        # ausschließlich den jüngsten Eintrag
+        with open(summary_file, 'r') as f:
+            header = f.readline()
+            tail = deque(f, maxlen=1)
+        if tail:
+            latest = pd.read_csv(io.StringIO(header + tail[0])).iloc[0]
             print(f"\n📈 GESAMTSTATISTIK:")
             print(f"   Gesamtkapital: €{latest['Total_Capital']:.2f}")
             print(f"   Kumulativer Gewinn: €{latest['Cumulative_Profit']:.2f}")
@@ -207,10 +234,19 @@ def show_bet_details(simulation_log):
     """
     print("\n📋 WETT-DETAILS:")
     print("-" * 40)
-    
-    for bet in simulation_log:
-        outcome_emoji = "✅" if bet['Outcome'] == 'WIN' else "❌"
-        print(f"{outcome_emoji} {bet['Driver']}: Position {bet['Actual_Position']} - €{bet['Profit_Loss']:.2f}")
+
+    import sys
+    import numpy as np
+    import pandas as pd
+
+    # Zeilen vektorisiert zusammensetzen und mit einem einzigen
+    # write ausgeben statt print pro Wette
+    df = pd.DataFrame(simulation_log)
+    emoji = np.where(df['Outcome'] == 'WIN', '✅', '❌')
+    lines = (emoji + ' ' + df['Driver'].astype(str) + ': Position '
+             + df['Actual_Position'].astype(str) + ' - €'
+             + df['Profit_Loss'].map('{:.2f}'.format))
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 def main():
     """
@@ -4,17 +4,39 @@ Test Script für Supabase Integration
 Zeigt alle verfügbaren Features nach dem Setup
 """
 
+import asyncio
+import functools
+import sys
 import pandas as pd
 from datetime import datetime
 import os
 
+@functools.lru_cache(maxsize=1)
+def _db_client():
+    """Ein Supabase-Client für alle Tests statt fünf Neuauflösungen"""
+    from ml.database.supabase_client import get_db_client
+    return get_db_client()
+
+# Einmal als Paket-Import auflösen statt sys.path bei jedem Testlauf
+# zu verlängern - jeder zusätzliche Pfadeintrag verlangsamt alle
+# folgenden Importe
+try:
+    from ml.enhanced_odds_fetcher import EnhancedOddsFetcher
+except ImportError:
+    EnhancedOddsFetcher = None
+
+@functools.lru_cache(maxsize=1)
+def _fetcher():
+    """Ein EnhancedOddsFetcher für Fetcher- und Analytics-Test"""
+    if EnhancedOddsFetcher is None:
+        raise ImportError("enhanced_odds_fetcher nicht gefunden")
+    return EnhancedOddsFetcher()
+
 def test_database_connection():
     """Teste die Datenbankverbindung"""
     print("🔍 1. Teste Datenbankverbindung...")
     try:
-        from ml.database.supabase_client import get_db_client
-        
-        db_client = get_db_client()
+        db_client = _db_client()
         if db_client.test_connection():
             print("✅ Datenbankverbindung erfolgreich!")
             return True
@@ -30,12 +52,7 @@ def test_enhanced_odds_fetcher():
     """Teste den Enhanced Odds Fetcher"""
     print("🏎️ 2. Teste Enhanced Odds Fetcher...")
     try:
-        import sys
-        sys.path.append(os.path.join(os.path.dirname(__file__), 'ml'))
-        
-        from enhanced_odds_fetcher import EnhancedOddsFetcher
-        
-        fetcher = EnhancedOddsFetcher()
+        fetcher = _fetcher()
         print("✅ Enhanced Odds Fetcher erfolgreich initialisiert!")
         
         # Teste API-Verbindung (ohne echte API-Calls)
@@ -49,15 +66,15 @@ def test_enhanced_odds_fetcher():
         print(f"❌ Fehler: {e}")
         return False
 
-def test_sample_data_storage():
+async def test_sample_data_storage(parallel=True):
     """Teste das Speichern von Beispieldaten"""
     print("\n📊 3. Teste Datenspeicherung...")
     try:
-        from ml.database.supabase_client import get_db_client
-        
-        db_client = get_db_client()
-        
-        # Erstelle Beispiel-Odds-Daten
+        db_client = _db_client()
+
+        # Erstelle Beispiel-Odds-Daten - ein Zeitstempel für alle
+        # Zeilen statt datetime.now() pro Datensatz
+        now = datetime.now()
         sample_odds = pd.DataFrame([
             {
                 'race_name': 'Test Grand Prix 2025',
@@ -65,7 +82,7 @@ def test_sample_data_storage():
                 'bookmaker': 'Test Bookmaker',
                 'odds': 1.85,
                 'market_type': 'winner',
-                'fetch_timestamp': datetime.now()
+                'fetch_timestamp': now
             },
             {
                 'race_name': 'Test Grand Prix 2025',
@@ -73,15 +90,10 @@ def test_sample_data_storage():
                 'bookmaker': 'Test Bookmaker',
                 'odds': 3.20,
                 'market_type': 'winner',
-                'fetch_timestamp': datetime.now()
+                'fetch_timestamp': now
             }
         ])
         
-        # Speichere in Supabase
-        result = db_client.store_odds_data(sample_odds, 'Test Grand Prix 2025')
-        if result:
-            print("✅ Beispiel-Odds erfolgreich gespeichert")
-        
         # Erstelle Beispiel-Vorhersagen
         sample_predictions = pd.DataFrame([
             {
@@ -102,33 +114,48 @@ def test_sample_data_storage():
             }
         ])
         
-        # Speichere Vorhersagen
-        result = db_client.store_predictions(sample_predictions, 'Test Grand Prix 2025')
-        if result:
+        # Beide Inserts überlappen ihre Netzwerk-Roundtrips per
+        # asyncio.gather; mit --no-async laufen sie nacheinander
+        if parallel:
+            odds_result, pred_result = await asyncio.gather(
+                asyncio.to_thread(db_client.store_odds_data, sample_odds, 'Test Grand Prix 2025'),
+                asyncio.to_thread(db_client.store_predictions, sample_predictions, 'Test Grand Prix 2025')
+            )
+        else:
+            odds_result = await asyncio.to_thread(db_client.store_odds_data, sample_odds, 'Test Grand Prix 2025')
+            pred_result = await asyncio.to_thread(db_client.store_predictions, sample_predictions, 'Test Grand Prix 2025')
+
+        if odds_result:
+            print("✅ Beispiel-Odds erfolgreich gespeichert")
+        if pred_result:
             print("✅ Beispiel-Vorhersagen erfolgreich gespeichert")
-        
+
         return True
         
     except Exception as e:
         print(f"❌ Fehler beim Speichern: {e}")
         return False
 
-def test_data_retrieval():
+async def test_data_retrieval(parallel=True):
     """Teste das Abrufen von Daten"""
     print("\n📈 4. Teste Datenabruf...")
     try:
-        from ml.database.supabase_client import get_db_client
-        
-        db_client = get_db_client()
-        
-        # Teste Odds-Abruf
-        latest_odds = db_client.get_latest_odds('Test Grand Prix 2025')
+        db_client = _db_client()
+
+        # Odds- und Vorhersagen-Abruf gleichzeitig starten
+        if parallel:
+            latest_odds, predictions = await asyncio.gather(
+                asyncio.to_thread(db_client.get_latest_odds, 'Test Grand Prix 2025'),
+                asyncio.to_thread(db_client.get_predictions, 'Test Grand Prix 2025')
+            )
+        else:
+            latest_odds = await asyncio.to_thread(db_client.get_latest_odds, 'Test Grand Prix 2025')
+            predictions = await asyncio.to_thread(db_client.get_predictions, 'Test Grand Prix 2025')
+
         if not latest_odds.empty:
             print(f"✅ {len(latest_odds)} Odds-Datensätze abgerufen")
             print("   Beispiel:", latest_odds.iloc[0]['driver'], "-", latest_odds.iloc[0]['odds'])
-        
-        # Teste Vorhersagen-Abruf
-        predictions = db_client.get_predictions('Test Grand Prix 2025')
+
         if not predictions.empty:
             print(f"✅ {len(predictions)} Vorhersage-Datensätze abgerufen")
             print("   Beispiel:", predictions.iloc[0]['driver'], "-", f"{predictions.iloc[0]['win_probability']:.1%}")
@@ -143,10 +170,8 @@ def test_analytics_features():
     """Teste Analytics-Features"""
     print("\n🔍 5. Teste Analytics-Features...")
     try:
-        from ml.enhanced_odds_fetcher import EnhancedOddsFetcher
-        
-        fetcher = EnhancedOddsFetcher()
-        
+        fetcher = _fetcher()
+
         # Teste Best Odds
         best_odds = fetcher.get_best_odds('Test Grand Prix 2025')
         if not best_odds.empty:
@@ -210,12 +235,14 @@ def main():
     if not test_enhanced_odds_fetcher():
         return
     
-    # Test 3: Datenspeicherung
-    if not test_sample_data_storage():
+    # Test 3 und 4: Datenspeicherung und -abruf (asynchron, mit
+    # --no-async laufen die Einzelaufrufe seriell wie früher)
+    parallel = '--no-async' not in sys.argv
+
+    if not asyncio.run(test_sample_data_storage(parallel=parallel)):
         return
-    
-    # Test 4: Datenabruf
-    if not test_data_retrieval():
+
+    if not asyncio.run(test_data_retrieval(parallel=parallel)):
         return
     
     # Test 5: Analytics
@@ -0,0 +1,66 @@
+"""Gepufferte Ausgabe für parallel laufende Test-Skripte
+
+Wird von test_complete_system.py und test_openf1_integration.py geteilt,
+damit der Thread-Local-Stdout-Proxy nicht in jedem Skript dupliziert wird.
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ThreadLocalStdout:
+    """Leitet print-Ausgaben in den Puffer des jeweiligen Test-Threads um
+
+    So bleiben die Ausgaben parallel laufender Tests lesbar gruppiert
+    statt zeilenweise vermischt.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, buffer):
+        self._local.buffer = buffer
+
+    def write(self, text):
+        getattr(self._local, 'buffer', self._fallback).write(text)
+
+    def flush(self):
+        buffer = getattr(self._local, 'buffer', self._fallback)
+        if hasattr(buffer, 'flush'):
+            buffer.flush()
+
+
+def run_tests_buffered(tests, runner, max_workers=None):
+    """Führt Tests parallel aus und gibt ihre Ausgaben gruppiert aus
+
+    tests ist eine Folge von (Name, Testfunktion)-Paaren, runner(name, func)
+    führt einen einzelnen Test aus. Jeder Thread schreibt in einen eigenen
+    Puffer; nach dem Lauf werden die Puffer in Testreihenfolge am Stück
+    ausgegeben. Liefert die Liste der (Name, Ergebnis)-Paare.
+    """
+    tests = list(tests)
+    proxy = ThreadLocalStdout(sys.stdout)
+    buffers = {}
+
+    def run(name, func):
+        buffer = io.StringIO()
+        buffers[name] = buffer
+        proxy.register(buffer)
+        return runner(name, func)
+
+    original_stdout = sys.stdout
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers or len(tests)) as executor:
+            futures = [(name, executor.submit(run, name, func)) for name, func in tests]
+            results = [(name, future.result()) for name, future in futures]
+    finally:
+        sys.stdout = original_stdout
+
+    for name, _ in tests:
+        sys.stdout.write(buffers[name].getvalue())
+
+    return results